@@ -79,7 +79,8 @@ import arcpy
 import psutil
 from arcpy import env
 import sddt.construct.build_parallel as bp
-reload(bp)
+if os.environ.get('SDDT_DEV_RELOAD'):
+    reload(bp)
 # from sddt.construct import build_parallel as bp
 
 Tist = TypeVar("Tist", tuple, list)
@@ -264,14 +265,16 @@ def getSSAList(input_p: str) -> Set[str,]:
     Set[str,]
         The directory names of the SSURGO datasets found in ``input_p``.
     """
+    join = os.path.join
+    exists = os.path.exists
     present_ssa = {
         ssa.lower()
         for d in os.scandir(input_p)
         if (d.is_dir() and re.match(
             r"[a-zA-Z]{2}[0-9]{3}", (ssa := d.name.removeprefix('soil_'))
             )
-            and os.path.exists(f"{d.path}/tabular")
-            and os.path.exists(f"{d.path}/spatial")
+            and exists(join(d.path, 'tabular'))
+            and exists(join(d.path, 'spatial'))
     )}
     return present_ssa
 
@@ -1646,7 +1649,7 @@ def gSSURGO(input_p: str,
             f"Successfully created {gdb_p} "
             f"\nWhich includes the following surveys:"
         )
-        for line in re.findall('.{1,80}\W', survey_i):
+        for line in re.findall(r'.{1,80}\W', survey_i):
             arcpy.AddMessage(line.replace("'", " "))
         return True
 
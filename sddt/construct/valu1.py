@@ -832,7 +832,24 @@ def compAg(
         return () # msg + f"{nccpi_d[cokey]=}; {cokey=}"
 
 
-def batch(gdb_p, module_p):
+def batch(gdb_p: str, module_p: str) -> tuple[bool, bool]:
+    """Creates and populates the Valu1 and DominantComponent tables of a
+    SSURGO file geodatabase.
+
+    Parameters
+    ----------
+    gdb_p : str
+        Path of the SSURGO file geodatabase
+    module_p : str
+        Path of the construct folder with the table schemas
+
+    Returns
+    -------
+    tuple[bool, bool]
+        Whether the Valu1 and the DominantComponent tables were populated
+    """
+    valu1_b = False
+    domcom_b = False
     try:
         d_ranges = (
             (0,5), (5, 20), (20, 50), (50, 100), (100, 150), (150, 999),
@@ -1121,36 +1138,82 @@ def batch(gdb_p, module_p):
                 ]
                 iCur.insertRow(v_row)
                 dom_com_d[mk]= mu_t[-2:]
+        valu1_b = True
 
         # Populate Dominant Component table
         with arcpy.da.InsertCursor(**tabs_d['dom_com']) as iCur:
             for dom_com_its in dom_com_d.items():
                 mk, (ck, pct) = dom_com_its
                 iCur.insertRow([mk, ck, pct])
+        domcom_b = True
 
-        return True
+        return valu1_b, domcom_b
 
     except arcpy.ExecuteError:
         func = sys._getframe().f_code.co_name
         arcpy.AddError(arcpyErr(func))
-        return False
+        return valu1_b, domcom_b
     except:
         func = sys._getframe().f_code.co_name
         arcpy.AddError(pyErr(func))
-        return False
+        return valu1_b, domcom_b
+
+def worker(gdb_p: str, module_p: str) -> tuple[tuple[bool, bool], list]:
+    """Runs batch in a worker process. Messages added there aren't shown
+    by the tool, so the errors are collected and returned instead.
+
+    Parameters
+    ----------
+    gdb_p : str
+        Path of the SSURGO file geodatabase
+    module_p : str
+        Path of the construct folder with the table schemas
+
+    Returns
+    -------
+    tuple[tuple[bool, bool], list]
+        Whether the Valu1 and the DominantComponent tables were populated
+        and the error messages raised while building them
+    """
+    err_l = []
+    add_error = arcpy.AddError
+    arcpy.AddError = err_l.append
+    try:
+        return batch(gdb_p, module_p), err_l
+    finally:
+        # Worker processes are reused by the pool
+        arcpy.AddError = add_error
+
 
 def main(args):
+    """Creates the Valu1 and DominantComponent tables for one or more
+    SSURGO file geodatabases.
+
+    Parameters
+    ----------
+    args : list
+        [0] Path of a geodatabase, or a list of geodatabases
+        [1] Path of the construct folder with the table schemas
+
+    Returns
+    -------
+    tuple[bool, bool] | list[tuple[bool, bool]]
+        Whether the Valu1 and the DominantComponent tables were populated,
+        one per geodatabase when a list is given
+    """
     gdbs = args[0]
     module_p = args[1]
     
-    if type(gdbs) == str:
+    if isinstance(gdbs, str):
         gdb_p = gdbs
         return batch(gdb_p, module_p)
     else:
+        complete_l = []
         for gdb in gdbs:
             d = arcpy.Describe(gdb)
             gdb_p = d.catalogPath
-            batch(gdb_p, module_p)
+            complete_l.append(batch(gdb_p, module_p))
+        return complete_l
 
 
 if __name__ == '__main__':